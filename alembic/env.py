@@ -10,6 +10,8 @@ from app.db.base import Base
 from app.models.product import Product
 from app.models.order import Order
 from app.models.order_item import OrderItem
+from app.models.reservation import Reservation
+from app.models.reservation_item import ReservationItem
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,28 @@
+"""add orders status created_at index
+
+Revision ID: 3e8b5d2c6a41
+Revises: 7c4e1a9f3b2d
+Create Date: 2026-10-19 18:42:37.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8b5d2c6a41'
+down_revision: Union[str, Sequence[str], None] = '7c4e1a9f3b2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_orders_status_created_at', 'orders', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_status_created_at', table_name='orders')
@@ -0,0 +1,54 @@
+"""add reservations
+
+Revision ID: 7c4e1a9f3b2d
+Revises: 2189d23b91c5
+Create Date: 2026-10-19 18:05:12.418302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e1a9f3b2d'
+down_revision: Union[str, Sequence[str], None] = '2189d23b91c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('reservations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('status', sa.Enum('Active', 'Confirmed', 'Released', 'Expired', name='reservation_status'), nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_reservations_status_expires_at', 'reservations', ['status', 'expires_at'], unique=False)
+    op.create_table('reservation_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('reservation_id', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.CheckConstraint('quantity > 0', name='ck_reservation_items_qty_positive'),
+    sa.ForeignKeyConstraint(['reservation_id'], ['reservations.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_reservation_items_reservation_id'), 'reservation_items', ['reservation_id'], unique=False)
+    op.create_index(op.f('ix_reservation_items_product_id'), 'reservation_items', ['product_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_reservation_items_product_id'), table_name='reservation_items')
+    op.drop_index(op.f('ix_reservation_items_reservation_id'), table_name='reservation_items')
+    op.drop_table('reservation_items')
+    op.drop_index('ix_reservations_status_expires_at', table_name='reservations')
+    op.drop_table('reservations')
+    sa.Enum(name='reservation_status').drop(op.get_bind(), checkfirst=True)
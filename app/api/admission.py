@@ -0,0 +1,112 @@
+import asyncio
+import logging
+
+import anyio.to_thread
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.metrics import counters
+
+logger = logging.getLogger(__name__)
+
+_limiters: list["ConcurrencyLimiter"] = []
+
+class ConcurrencyLimiter:
+    """
+    Per-route admission control, used as a route dependency.
+
+    At most `max_concurrent` requests run the route at once; up to `max_queue`
+    more wait (on the event loop, not in a threadpool thread) for at most
+    `queue_timeout` seconds. Anything beyond that is rejected immediately with
+    429 and Retry-After. Limits are per worker process.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float, retry_after: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._waiting = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives bind to one loop; rebuild if the app is served from a new one
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._waiting = 0
+        return self._semaphore
+
+    def _reject(self, reason: str, detail: str) -> HTTPException:
+        counters.incr(f"{self.name}.{reason}")
+        return HTTPException(
+            status_code=429,
+            detail=detail,
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    async def __call__(self):
+        semaphore = self._get_semaphore()
+
+        if semaphore.locked():
+            if self._waiting >= self.max_queue:
+                raise self._reject("shed", "Too many concurrent requests, please retry")
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise self._reject("queue_timeout", "Timed out waiting for capacity, please retry")
+            finally:
+                self._waiting -= 1
+        else:
+            await semaphore.acquire()
+
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+def _route_limiter(*args, **kwargs) -> ConcurrencyLimiter:
+    # Route limiters are tracked so their permits can be checked against the threadpool
+    limiter = ConcurrencyLimiter(*args, **kwargs)
+    _limiters.append(limiter)
+    return limiter
+
+def order_write_limiter(name: str) -> ConcurrencyLimiter:
+    return _route_limiter(
+        name,
+        max_concurrent=settings.ORDER_WRITE_MAX_CONCURRENCY,
+        max_queue=settings.ORDER_WRITE_MAX_QUEUE,
+        queue_timeout=settings.ORDER_WRITE_QUEUE_TIMEOUT_SECONDS,
+        retry_after=settings.RETRY_AFTER_SECONDS,
+    )
+
+def wave_plan_limiter(name: str) -> ConcurrencyLimiter:
+    return _route_limiter(
+        name,
+        max_concurrent=settings.WAVE_PLAN_MAX_CONCURRENCY,
+        max_queue=settings.WAVE_PLAN_MAX_QUEUE,
+        queue_timeout=settings.WAVE_PLAN_QUEUE_TIMEOUT_SECONDS,
+        retry_after=settings.RETRY_AFTER_SECONDS,
+    )
+
+def check_threadpool_capacity() -> bool:
+    """
+    Sync endpoints (and get_db) run in anyio's default threadpool. If the
+    limited routes together can take every thread, a saturated route still
+    starves the rest of the API; warn at startup so the limits get lowered.
+    Must be called from the event loop.
+    """
+    threads = anyio.to_thread.current_default_thread_limiter().total_tokens
+    permits = sum(limiter.max_concurrent for limiter in _limiters)
+    if permits >= threads:
+        logger.warning(
+            "Admission limits allow %d concurrent requests but the threadpool has %d threads; "
+            "lower ORDER_WRITE_MAX_CONCURRENCY / WAVE_PLAN_MAX_CONCURRENCY",
+            permits, threads,
+        )
+        return False
+    return True
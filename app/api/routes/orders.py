@@ -3,28 +3,43 @@ from fastapi.params import Query
 from sqlalchemy.orm import Session
 from datetime import date
 
+from app.api.admission import order_write_limiter
 from app.api.deps import get_db
 from app.models.order import OrderStatus
-from app.schemas.order import OrderCreate, OrderListResponse, OrderOut, OrderStatusUpdate
-from app.services.order_service import create_order, get_order, list_orders, update_order_status
-from app.services.order_service import filter_orders as filter_orders_svc
+from app.schemas.order import (
+    OrderCreate,
+    OrderListResponse,
+    OrderListView,
+    OrderOut,
+    OrderStatusUpdate,
+    OrderSummaryListResponse,
+)
+from app.services.order_service import create_order, get_order, list_order_summaries, list_orders, update_order_status
+from app.services.order_service import filter_order_summaries, filter_orders as filter_orders_svc
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
-@router.post("", response_model=OrderOut, status_code=201)
+create_order_limiter = order_write_limiter("orders.create")
+update_status_limiter = order_write_limiter("orders.update_status")
+
+@router.post("", response_model=OrderOut, status_code=201, dependencies=[Depends(create_order_limiter)])
 def create_order_endpoint(payload: OrderCreate, db: Session = Depends(get_db)):
     return create_order(db, payload)
 
-@router.get("", response_model=OrderListResponse)
+@router.get("", response_model=OrderListResponse | OrderSummaryListResponse)
 def list_orders_endpoint(
     db: Session = Depends(get_db),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    view: OrderListView = Query(OrderListView.full, description="summary: totals per order, no items"),
 ):
-    total, items = list_orders(db, limit, offset)
+    if view == OrderListView.summary:
+        total, items = list_order_summaries(db, limit, offset)
+    else:
+        total, items = list_orders(db, limit, offset)
     return {"total": total, "limit": limit, "offset": offset, "items": items}
 
-@router.get("/search", response_model=OrderListResponse)
+@router.get("/search", response_model=OrderListResponse | OrderSummaryListResponse)
 def search_orders(
     db: Session = Depends(get_db),
     product_name: str | None = Query(None, min_length=1),
@@ -33,14 +48,18 @@ def search_orders(
     date_to: date | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    view: OrderListView = Query(OrderListView.full, description="summary: totals per order, no items"),
 ):
-    total, items = filter_orders_svc(db, product_name, status, date_from, date_to, limit, offset)
+    if view == OrderListView.summary:
+        total, items = filter_order_summaries(db, product_name, status, date_from, date_to, limit, offset)
+    else:
+        total, items = filter_orders_svc(db, product_name, status, date_from, date_to, limit, offset)
     return {"total": total, "limit": limit, "offset": offset, "items": items}
 
 @router.get("/{order_id}", response_model=OrderOut)
 def get_order_endpoint(order_id: int, db: Session = Depends(get_db)):
     return get_order(db, order_id)
 
-@router.patch("/{order_id}/status", response_model=OrderOut)
+@router.patch("/{order_id}/status", response_model=OrderOut, dependencies=[Depends(update_status_limiter)])
 def update_status_endpoint(order_id: int, payload: OrderStatusUpdate, db: Session = Depends(get_db)):
     return update_order_status(db, order_id, payload.status)
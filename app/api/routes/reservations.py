@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.api.admission import order_write_limiter
+from app.api.deps import get_db
+from app.schemas.order import OrderOut
+from app.schemas.reservation import ReservationCreate, ReservationOut
+from app.services.reservation_service import confirm_reservation, create_reservation, get_reservation, release_reservation
+
+router = APIRouter(prefix="/reservations", tags=["reservations"])
+
+create_reservation_limiter = order_write_limiter("reservations.create")
+confirm_reservation_limiter = order_write_limiter("reservations.confirm")
+
+@router.post("", response_model=ReservationOut, status_code=201, dependencies=[Depends(create_reservation_limiter)])
+def create_reservation_endpoint(payload: ReservationCreate, db: Session = Depends(get_db)):
+    return create_reservation(db, payload)
+
+@router.get("/{reservation_id}", response_model=ReservationOut)
+def get_reservation_endpoint(reservation_id: int, db: Session = Depends(get_db)):
+    return get_reservation(db, reservation_id)
+
+@router.post("/{reservation_id}/confirm", response_model=OrderOut, status_code=201, dependencies=[Depends(confirm_reservation_limiter)])
+def confirm_reservation_endpoint(reservation_id: int, db: Session = Depends(get_db)):
+    return confirm_reservation(db, reservation_id)
+
+@router.post("/{reservation_id}/release", response_model=ReservationOut)
+def release_reservation_endpoint(reservation_id: int, db: Session = Depends(get_db)):
+    return release_reservation(db, reservation_id)
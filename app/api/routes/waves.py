@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.api.admission import wave_plan_limiter
+from app.api.deps import get_db
+from app.schemas.wave import WavePlanOut, WavePlanRequest
+from app.services.wave_service import plan_waves
+
+router = APIRouter(prefix="/waves", tags=["waves"])
+
+plan_waves_limiter = wave_plan_limiter("waves.plan")
+
+@router.post("/plan", response_model=WavePlanOut, dependencies=[Depends(plan_waves_limiter)])
+def plan_waves_endpoint(payload: WavePlanRequest, db: Session = Depends(get_db)):
+    return plan_waves(
+        db,
+        payload.created_from,
+        payload.created_to,
+        payload.max_orders_per_wave,
+        payload.max_lines_per_wave,
+        payload.mark_shipped,
+    )
@@ -4,4 +4,41 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
     DATABASE_URL: str
 
+    # Database connections: DB_MAX_CONNECTIONS is the total for all workers
+    # (keep it below Postgres max_connections); each worker gets its share
+    WEB_CONCURRENCY: int = 1
+    DB_MAX_CONNECTIONS: int = 80
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+
+    # Run hot queries/schemas once at startup before /health reports ready
+    WARMUP_ON_STARTUP: bool = False
+
+    # Admission control (per route, per worker process). The permits of all
+    # limited routes together must stay below the threadpool size (40 by
+    # default) so unlimited endpoints always have threads; checked at startup
+    ORDER_WRITE_MAX_CONCURRENCY: int = 4
+    ORDER_WRITE_MAX_QUEUE: int = 32
+    ORDER_WRITE_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    WAVE_PLAN_MAX_CONCURRENCY: int = 2
+    WAVE_PLAN_MAX_QUEUE: int = 4
+    WAVE_PLAN_QUEUE_TIMEOUT_SECONDS: float = 30.0
+    RETRY_AFTER_SECONDS: int = 1
+
+    # Order transactions: lock wait limit and retries on deadlock/serialization failure
+    ORDER_LOCK_TIMEOUT_MS: int = 2000
+    ORDER_TX_MAX_RETRIES: int = 3
+    ORDER_TX_RETRY_BASE_DELAY_SECONDS: float = 0.05
+
+    # Stock reservations (checkout holds)
+    RESERVATION_TTL_SECONDS: int = 900
+    RESERVATION_MAX_TTL_SECONDS: int = 3600
+    RESERVATION_SWEEPER_ENABLED: bool = False
+    RESERVATION_SWEEP_INTERVAL_SECONDS: float = 30.0
+    RESERVATION_SWEEP_BATCH_SIZE: int = 500
+
+    # Pick-wave planning
+    WAVE_MAX_ORDERS: int = 50
+    WAVE_MAX_LINES: int = 200
+
 settings = Settings()
@@ -0,0 +1,23 @@
+import threading
+from collections import defaultdict
+
+class Counters:
+    """Process-local named counters, safe to bump from threadpool workers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: dict[str, int] = defaultdict(int)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._values[name] += amount
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+counters = Counters()
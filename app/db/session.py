@@ -1,6 +1,45 @@
+import logging
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+logger = logging.getLogger(__name__)
+
+def pool_limits(
+    max_connections: int,
+    workers: int,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> tuple[int, int]:
+    """
+    Per-process (pool_size, max_overflow) so that workers * (pool_size + max_overflow)
+    stays within max_connections. Explicit values win but are warned about if they
+    overshoot the budget.
+    """
+    budget = max(max_connections // max(workers, 1), 1)
+    if pool_size is None:
+        pool_size = min(5, budget)
+    if max_overflow is None:
+        max_overflow = max(budget - pool_size, 0)
+    if workers * (pool_size + max_overflow) > max_connections:
+        logger.warning(
+            "%d workers x (pool_size=%d + max_overflow=%d) exceeds DB_MAX_CONNECTIONS=%d",
+            workers, pool_size, max_overflow, max_connections,
+        )
+    return pool_size, max_overflow
+
+_pool_size, _max_overflow = pool_limits(
+    settings.DB_MAX_CONNECTIONS,
+    settings.WEB_CONCURRENCY,
+    settings.DB_POOL_SIZE,
+    settings.DB_MAX_OVERFLOW,
+)
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=_pool_size,
+    max_overflow=_max_overflow,
+)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
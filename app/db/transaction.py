@@ -0,0 +1,57 @@
+import random
+import time
+from typing import Callable, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import counters
+
+T = TypeVar("T")
+
+LOCK_NOT_AVAILABLE = "55P03"
+SERIALIZATION_FAILURE = "40001"
+DEADLOCK_DETECTED = "40P01"
+RETRYABLE_SQLSTATES = {SERIALIZATION_FAILURE, DEADLOCK_DETECTED}
+
+def _sqlstate(exc: DBAPIError) -> str | None:
+    orig = exc.orig
+    return getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+
+def is_lock_timeout(exc: DBAPIError) -> bool:
+    return _sqlstate(exc) == LOCK_NOT_AVAILABLE
+
+def is_retryable(exc: DBAPIError) -> bool:
+    return _sqlstate(exc) in RETRYABLE_SQLSTATES
+
+def set_lock_timeout(db: Session, timeout_ms: int) -> None:
+    # SET does not accept bind parameters; the value is an int from settings
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text(f"SET LOCAL lock_timeout = {int(timeout_ms)}"))
+
+def run_in_transaction(db: Session, fn: Callable[[], T]) -> T:
+    """
+    Run fn inside db.begin() with a bounded lock wait. Deadlocks and
+    serialization failures roll back and are retried with full-jitter
+    exponential backoff; anything else (including lock timeouts) propagates.
+    """
+    attempt = 0
+    while True:
+        try:
+            with db.begin():
+                set_lock_timeout(db, settings.ORDER_LOCK_TIMEOUT_MS)
+                return fn()
+        except DBAPIError as exc:
+            if is_lock_timeout(exc):
+                counters.incr("db.lock_timeout")
+                raise
+            if not is_retryable(exc):
+                raise
+            if attempt >= settings.ORDER_TX_MAX_RETRIES:
+                counters.incr("db.retry_exhausted")
+                raise
+            attempt += 1
+            counters.incr("db.retried")
+            time.sleep(random.uniform(0, settings.ORDER_TX_RETRY_BASE_DELAY_SECONDS * 2 ** attempt))
@@ -1,8 +1,73 @@
+import asyncio
+import contextlib
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import products, orders
+from fastapi.responses import JSONResponse
+from app.api.admission import check_threadpool_capacity
+from app.api.routes import products, orders, reservations, waves
+from app.core.config import settings
+from app.core.metrics import counters
+from app.db.session import SessionLocal
+from app.services.reservation_service import sweep_expired_reservations
+from app.services.warmup_service import warmup
+
+logger = logging.getLogger(__name__)
+
+def _run_warmup():
+    db = SessionLocal()
+    try:
+        warmup(db)
+    except Exception:
+        # A cold worker is still better than one stuck in a restart loop
+        logger.exception("Warmup failed; serving with cold caches")
+    finally:
+        db.close()
+
+def _run_reservation_sweep():
+    db = SessionLocal()
+    try:
+        sweep_expired_reservations(db, settings.RESERVATION_SWEEP_BATCH_SIZE)
+    except Exception:
+        logger.exception("Reservation sweep failed")
+    finally:
+        db.close()
+
+async def _reservation_sweeper():
+    while True:
+        sweep = asyncio.ensure_future(run_in_threadpool(_run_reservation_sweep))
+        try:
+            await asyncio.shield(sweep)
+        except asyncio.CancelledError:
+            # Cancelling cannot stop the thread; let the running sweep finish its transaction
+            await sweep
+            raise
+        await asyncio.sleep(settings.RESERVATION_SWEEP_INTERVAL_SECONDS)
 
-app = FastAPI(title="Logistics Service")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+    check_threadpool_capacity()
+    if settings.WARMUP_ON_STARTUP:
+        await run_in_threadpool(_run_warmup)
+
+    sweeper = None
+    if settings.RESERVATION_SWEEPER_ENABLED:
+        sweeper = asyncio.create_task(_reservation_sweeper())
+
+    app.state.ready = True
+    yield
+
+    if sweeper:
+        sweeper.cancel()
+        # Waits for a sweep already in the threadpool to finish before shutdown continues
+        with contextlib.suppress(asyncio.CancelledError):
+            await sweeper
+
+app = FastAPI(title="Logistics Service", lifespan=lifespan)
 
 # CORS Configuration
 app.add_middleware(
@@ -18,7 +83,16 @@ app.add_middleware(
 
 app.include_router(products.router)
 app.include_router(orders.router)
+app.include_router(reservations.router)
+app.include_router(waves.router)
 
 @app.get("/health")
 def health():
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
     return {"status": "ok"}
+
+@app.get("/metrics/admission")
+def admission_metrics():
+    # Shed/timed-out/retried counts for this worker process
+    return {"counters": counters.snapshot()}
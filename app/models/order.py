@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import DateTime, Enum, func
+from sqlalchemy import DateTime, Enum, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -19,3 +19,8 @@ class Order(Base):
     )
 
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Pending orders by age: wave planning window scans
+        Index("ix_orders_status_created_at", "status", "created_at"),
+    )
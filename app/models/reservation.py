@@ -0,0 +1,29 @@
+import enum
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.db.base import Base
+
+class ReservationStatus(str, enum.Enum):
+    Active = "Active"
+    Confirmed = "Confirmed"
+    Released = "Released"
+    Expired = "Expired"
+
+class Reservation(Base):
+    __tablename__ = "reservations"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    expires_at: Mapped[str] = mapped_column(DateTime(timezone=True))
+    status: Mapped[ReservationStatus] = mapped_column(
+        Enum(ReservationStatus, name="reservation_status"),
+        default=ReservationStatus.Active
+    )
+    order_id: Mapped[int | None] = mapped_column(ForeignKey("orders.id"), nullable=True)
+
+    items = relationship("ReservationItem", back_populates="reservation", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Serves both the expiry sweep and the active-holds lookup without full scans
+        Index("ix_reservations_status_expires_at", "status", "expires_at"),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import CheckConstraint, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.db.base import Base
+
+class ReservationItem(Base):
+    __tablename__ = "reservation_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    reservation_id: Mapped[int] = mapped_column(ForeignKey("reservations.id", ondelete="CASCADE"), index=True)
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), index=True)
+
+    quantity: Mapped[int] = mapped_column()
+
+    reservation = relationship("Reservation", back_populates="items")
+
+    __table_args__ = (
+        CheckConstraint("quantity > 0", name="ck_reservation_items_qty_positive"),
+    )
@@ -1,3 +1,4 @@
+import enum
 from pydantic import BaseModel, Field
 from typing import List
 from datetime import datetime
@@ -34,4 +35,22 @@ class OrderListResponse(BaseModel):
     total: int
     limit: int
     offset: int
-    items: List[OrderOut]
\ No newline at end of file
+    items: List[OrderOut]
+
+class OrderListView(str, enum.Enum):
+    full = "full"
+    summary = "summary"
+
+class OrderSummaryOut(BaseModel):
+    id: int
+    status: OrderStatus
+    created_at: datetime
+    item_count: int
+    total_quantity: int
+    total_amount: float
+
+class OrderSummaryListResponse(BaseModel):
+    total: int
+    limit: int
+    offset: int
+    items: List[OrderSummaryOut]
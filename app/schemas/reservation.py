@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import datetime
+from app.core.config import settings
+from app.models.reservation import ReservationStatus
+from app.schemas.order import OrderItemCreate
+
+class ReservationCreate(BaseModel):
+    items: List[OrderItemCreate] = Field(min_length=1)
+    ttl_seconds: int | None = Field(None, gt=0, le=settings.RESERVATION_MAX_TTL_SECONDS)
+
+class ReservationItemOut(BaseModel):
+    id: int
+    product_id: int
+    quantity: int
+
+    model_config = {"from_attributes": True}
+
+class ReservationOut(BaseModel):
+    id: int
+    status: ReservationStatus
+    created_at: datetime
+    expires_at: datetime
+    order_id: int | None
+    items: List[ReservationItemOut]
+
+    model_config = {"from_attributes": True}
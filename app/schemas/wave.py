@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import datetime
+from app.core.config import settings
+
+class WavePlanRequest(BaseModel):
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    max_orders_per_wave: int = Field(settings.WAVE_MAX_ORDERS, ge=1, le=10_000)
+    max_lines_per_wave: int = Field(settings.WAVE_MAX_LINES, ge=1, le=100_000)
+    mark_shipped: bool = False
+
+class WavePickOut(BaseModel):
+    product_id: int
+    product_name: str
+    quantity: int
+
+class WaveOut(BaseModel):
+    wave_number: int
+    order_ids: List[int]
+    line_count: int
+    total_quantity: int
+    picks: List[WavePickOut]
+
+class WavePlanOut(BaseModel):
+    order_count: int
+    line_count: int
+    shipped: bool
+    waves: List[WaveOut]
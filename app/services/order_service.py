@@ -1,12 +1,16 @@
 from sqlalchemy import func, select
 from datetime import date, datetime, time, timedelta
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session, selectinload
 from fastapi import HTTPException
 
+from app.core.config import settings
+from app.db.transaction import is_lock_timeout, is_retryable, run_in_transaction
 from app.models.product import Product
 from app.models.order import Order, OrderStatus
 from app.models.order_item import OrderItem
 from app.schemas.order import OrderCreate
+from app.services.stock_service import merge_quantities, reserved_quantities, utcnow
 
 ALLOWED_TRANSITIONS = {
     OrderStatus.Pending: {OrderStatus.Shipped, OrderStatus.Cancelled},
@@ -14,65 +18,91 @@ ALLOWED_TRANSITIONS = {
     OrderStatus.Cancelled: set(),
 }
 
+def locked_products_query(product_ids: list[int]):
+    return (
+        select(Product)
+        .where(Product.id.in_(product_ids))
+        .with_for_update()
+    )
+
+def order_detail_query(order_id: int):
+    return (
+        select(Order)
+        .where(Order.id == order_id)
+        .options(
+            selectinload(Order.items).selectinload(OrderItem.product)
+        )
+    )
+
+def run_order_transaction(db: Session, fn):
+    try:
+        return run_in_transaction(db, fn)
+    except DBAPIError as exc:
+        if is_lock_timeout(exc):
+            detail = "Order is waiting on locks held by other orders, please retry"
+        elif is_retryable(exc):
+            # run_in_transaction only lets these through once retries are exhausted
+            detail = "Order conflicted with concurrent orders, please retry"
+        else:
+            raise
+        raise HTTPException(
+            status_code=503,
+            detail=detail,
+            headers={"Retry-After": str(settings.RETRY_AFTER_SECONDS)},
+        )
+
 def create_order(db: Session, payload: OrderCreate) -> Order:
-    requested = sorted(payload.items, key=lambda x: x.product_id)
-    product_ids = [i.product_id for i in requested]
-
-    with db.begin():
-        products = db.execute(
-            select(Product)
-            .where(Product.id.in_(product_ids))
-            .with_for_update()
-        ).scalars().all()
+    requested = merge_quantities(payload.items)
+    product_ids = sorted(requested)
+
+    def _create() -> int:
+        products = db.execute(locked_products_query(product_ids)).scalars().all()
 
         found = {p.id: p for p in products}
         missing = [pid for pid in product_ids if pid not in found]
         if missing:
             raise HTTPException(status_code=404, detail=f"Products not found: {missing}")
 
-        for item in requested:
-            p = found[item.product_id]
-            if p.stock_quantity < item.quantity:
+        held = reserved_quantities(db, product_ids, utcnow())
+        for product_id in product_ids:
+            p = found[product_id]
+            available = p.stock_quantity - held.get(p.id, 0)
+            if available < requested[product_id]:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Insufficient stock for product_id={p.id}. Available={p.stock_quantity}, requested={item.quantity}"
+                    detail=f"Insufficient stock for product_id={p.id}. Available={available}, requested={requested[product_id]}"
                 )
 
         order = Order(status=OrderStatus.Pending)
         db.add(order)
         db.flush()  # assign order.id
 
-        for item in requested:
-            p = found[item.product_id]
-            p.stock_quantity -= item.quantity
+        for product_id in product_ids:
+            p = found[product_id]
+            p.stock_quantity -= requested[product_id]
 
             db.add(OrderItem(
                 order_id=order.id,
                 product_id=p.id,
-                quantity_ordered=item.quantity,
+                quantity_ordered=requested[product_id],
                 price_at_time_of_order=float(p.price),
             ))
 
         db.flush()
+        return order.id
 
-    return get_order(db, order.id)
+    order_id = run_order_transaction(db, _create)
+    return get_order(db, order_id)
 
 def get_order(db: Session, order_id: int) -> Order:
-    q = (
-        select(Order)
-        .where(Order.id == order_id)
-        .options(
-            selectinload(Order.items).selectinload(OrderItem.product)
-        )
-    )
-    order = db.execute(q).scalar_one_or_none()
+    order = db.execute(order_detail_query(order_id)).scalar_one_or_none()
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     return order
 
 
 def update_order_status(db: Session, order_id: int, new_status: OrderStatus) -> Order:
-    with db.begin():
+    def _update() -> None:
         order = db.get(Order, order_id)
         if not order:
             raise HTTPException(status_code=404, detail="Order not found")
@@ -89,6 +119,7 @@ def update_order_status(db: Session, order_id: int, new_status: OrderStatus) ->
             order.status = new_status
             db.add(order)
 
+    run_order_transaction(db, _update)
     return get_order(db, order_id)
 
 
@@ -107,15 +138,11 @@ def list_orders(db: Session, limit: int, offset: int):
     items = db.execute(q).scalars().all()
     return total, items
 
-def filter_orders(
-    db: Session,
-    product_name_contains: str | None,
+def _order_conditions(
     status: OrderStatus | None,
     date_from: date | None,
     date_to: date | None,
-    limit: int,
-    offset: int,
-) -> tuple[int, list[Order]]:
+) -> list:
     conditions = []
 
     if status:
@@ -129,6 +156,19 @@ def filter_orders(
         dt_to_excl = datetime.combine(date_to + timedelta(days=1), time.min)
         conditions.append(Order.created_at < dt_to_excl)
 
+    return conditions
+
+def filter_orders(
+    db: Session,
+    product_name_contains: str | None,
+    status: OrderStatus | None,
+    date_from: date | None,
+    date_to: date | None,
+    limit: int,
+    offset: int,
+) -> tuple[int, list[Order]]:
+    conditions = _order_conditions(status, date_from, date_to)
+
     # If filtering by product name, join and paginate by distinct Order IDs
     if product_name_contains:
         pattern = f"%{product_name_contains}%"
@@ -190,4 +230,62 @@ def filter_orders(
         items_stmt = items_stmt.where(*conditions)
 
     items = db.execute(items_stmt).scalars().all()
-    return total, items
\ No newline at end of file
+    return total, items
+
+def _order_summaries(db: Session, conditions: list, limit: int, offset: int) -> tuple[int, list[dict]]:
+    # Aggregates straight from order_items: one row per order, no ORM objects loaded
+    total_stmt = select(func.count(Order.id))
+    if conditions:
+        total_stmt = total_stmt.where(*conditions)
+    total = db.execute(total_stmt).scalar_one()
+
+    # Paginate first so only the page's order lines are aggregated
+    page_stmt = (
+        select(Order.id, Order.status, Order.created_at)
+        .order_by(Order.created_at.desc(), Order.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    if conditions:
+        page_stmt = page_stmt.where(*conditions)
+    page = page_stmt.subquery("page")
+
+    line_amount = OrderItem.price_at_time_of_order * OrderItem.quantity_ordered
+    stmt = (
+        select(
+            page.c.id,
+            page.c.status,
+            page.c.created_at,
+            func.count(OrderItem.id).label("item_count"),
+            func.coalesce(func.sum(OrderItem.quantity_ordered), 0).label("total_quantity"),
+            func.coalesce(func.sum(line_amount), 0).label("total_amount"),
+        )
+        .select_from(page)
+        .outerjoin(OrderItem, OrderItem.order_id == page.c.id)
+        .group_by(page.c.id, page.c.status, page.c.created_at)
+        .order_by(page.c.created_at.desc(), page.c.id.desc())
+    )
+
+    items = [dict(row) for row in db.execute(stmt).mappings().all()]
+    return total, items
+
+def list_order_summaries(db: Session, limit: int, offset: int) -> tuple[int, list[dict]]:
+    return _order_summaries(db, [], limit, offset)
+
+def filter_order_summaries(
+    db: Session,
+    product_name_contains: str | None,
+    status: OrderStatus | None,
+    date_from: date | None,
+    date_to: date | None,
+    limit: int,
+    offset: int,
+) -> tuple[int, list[dict]]:
+    conditions = _order_conditions(status, date_from, date_to)
+
+    if product_name_contains:
+        # EXISTS instead of a join so totals still cover every line of a matching order
+        pattern = f"%{product_name_contains}%"
+        conditions.append(Order.items.any(OrderItem.product.has(Product.name.ilike(pattern))))
+
+    return _order_summaries(db, conditions, limit, offset)
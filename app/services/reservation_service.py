@@ -0,0 +1,178 @@
+import logging
+from datetime import timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.models.order import Order, OrderStatus
+from app.models.order_item import OrderItem
+from app.models.product import Product
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.reservation_item import ReservationItem
+from app.schemas.reservation import ReservationCreate
+from app.services.order_service import get_order, locked_products_query, run_order_transaction
+from app.services.stock_service import merge_quantities, reserved_quantities, utcnow
+
+logger = logging.getLogger(__name__)
+
+def create_reservation(db: Session, payload: ReservationCreate) -> Reservation:
+    requested = merge_quantities(payload.items)
+    product_ids = sorted(requested)
+    ttl = payload.ttl_seconds or settings.RESERVATION_TTL_SECONDS
+
+    def _reserve() -> int:
+        now = utcnow()
+        # Short lock: serializes concurrent availability checks on the same products
+        products = db.execute(locked_products_query(product_ids)).scalars().all()
+
+        found = {p.id: p for p in products}
+        missing = [pid for pid in product_ids if pid not in found]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Products not found: {missing}")
+
+        held = reserved_quantities(db, product_ids, now)
+        for product_id in product_ids:
+            p = found[product_id]
+            available = p.stock_quantity - held.get(p.id, 0)
+            if available < requested[product_id]:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Insufficient stock for product_id={p.id}. Available={available}, requested={requested[product_id]}"
+                )
+
+        reservation = Reservation(
+            status=ReservationStatus.Active,
+            expires_at=now + timedelta(seconds=ttl),
+            items=[ReservationItem(product_id=pid, quantity=requested[pid]) for pid in product_ids],
+        )
+        db.add(reservation)
+        db.flush()
+        return reservation.id
+
+    reservation_id = run_order_transaction(db, _reserve)
+    return get_reservation(db, reservation_id)
+
+def get_reservation(db: Session, reservation_id: int) -> Reservation:
+    reservation = db.execute(
+        select(Reservation)
+        .where(Reservation.id == reservation_id)
+        .options(selectinload(Reservation.items))
+    ).scalar_one_or_none()
+    if not reservation:
+        raise HTTPException(status_code=404, detail="Reservation not found")
+    return reservation
+
+def _claim(db: Session, reservation_id: int, new_status: ReservationStatus) -> None:
+    # Conditional update: only one caller can move an Active, unexpired hold
+    claimed = db.execute(
+        update(Reservation)
+        .where(
+            Reservation.id == reservation_id,
+            Reservation.status == ReservationStatus.Active,
+            Reservation.expires_at > utcnow(),
+        )
+        .values(status=new_status)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if claimed:
+        return
+
+    reservation = db.get(Reservation, reservation_id)
+    if not reservation:
+        raise HTTPException(status_code=404, detail="Reservation not found")
+    if reservation.status == ReservationStatus.Active:
+        raise HTTPException(status_code=400, detail="Reservation has expired")
+    raise HTTPException(status_code=400, detail=f"Reservation is {reservation.status.value}")
+
+def confirm_reservation(db: Session, reservation_id: int) -> Order:
+    def _confirm() -> int:
+        _claim(db, reservation_id, ReservationStatus.Confirmed)
+
+        items = db.execute(
+            select(ReservationItem)
+            .where(ReservationItem.reservation_id == reservation_id)
+            .order_by(ReservationItem.product_id)
+        ).scalars().all()
+
+        order = Order(status=OrderStatus.Pending)
+        db.add(order)
+        db.flush()  # assign order.id
+
+        # The hold already guaranteed availability, so no FOR UPDATE + recheck:
+        # a single atomic decrement per product, row locks held only until commit
+        for item in items:
+            price = db.execute(
+                update(Product)
+                .where(Product.id == item.product_id)
+                .values(stock_quantity=Product.stock_quantity - item.quantity)
+                .returning(Product.price)
+                .execution_options(synchronize_session=False)
+            ).scalar_one()
+
+            db.add(OrderItem(
+                order_id=order.id,
+                product_id=item.product_id,
+                quantity_ordered=item.quantity,
+                price_at_time_of_order=float(price),
+            ))
+
+        db.execute(
+            update(Reservation)
+            .where(Reservation.id == reservation_id)
+            .values(order_id=order.id)
+            .execution_options(synchronize_session=False)
+        )
+        db.flush()
+        return order.id
+
+    try:
+        order_id = run_order_transaction(db, _confirm)
+    except IntegrityError:
+        # Stock was lowered below the held quantity after the hold was taken
+        raise HTTPException(status_code=400, detail="Insufficient stock to confirm reservation")
+    return get_order(db, order_id)
+
+def release_reservation(db: Session, reservation_id: int) -> Reservation:
+    run_order_transaction(db, lambda: _claim(db, reservation_id, ReservationStatus.Released))
+    return get_reservation(db, reservation_id)
+
+def expire_reservations(db: Session, batch_size: int) -> int:
+    """
+    Mark one batch of lapsed holds Expired, oldest first. Walks
+    ix_reservations_status_expires_at rather than scanning the table, and
+    SKIP LOCKED lets several workers sweep concurrently.
+    """
+    with db.begin():
+        ids = db.execute(
+            select(Reservation.id)
+            .where(
+                Reservation.status == ReservationStatus.Active,
+                Reservation.expires_at <= utcnow(),
+            )
+            .order_by(Reservation.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+
+        if ids:
+            db.execute(
+                update(Reservation)
+                .where(Reservation.id.in_(ids))
+                .values(status=ReservationStatus.Expired)
+                .execution_options(synchronize_session=False)
+            )
+    return len(ids)
+
+def sweep_expired_reservations(db: Session, batch_size: int) -> int:
+    total = 0
+    while True:
+        expired = expire_reservations(db, batch_size)
+        total += expired
+        if expired < batch_size:
+            break
+    if total:
+        logger.info("Expired %d reservations", total)
+    return total
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.reservation_item import ReservationItem
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def merge_quantities(items) -> dict[int, int]:
+    """Total requested quantity per product_id, so repeated lines are checked and applied together."""
+    merged: dict[int, int] = {}
+    for item in items:
+        merged[item.product_id] = merged.get(item.product_id, 0) + item.quantity
+    return merged
+
+def reserved_quantities(db: Session, product_ids: list[int], now: datetime) -> dict[int, int]:
+    """
+    Quantity held per product by reservations that are still active. Holds past
+    their expiry count as released even before the sweeper marks them Expired.
+    """
+    rows = db.execute(
+        select(ReservationItem.product_id, func.sum(ReservationItem.quantity))
+        .join(Reservation, Reservation.id == ReservationItem.reservation_id)
+        .where(
+            ReservationItem.product_id.in_(product_ids),
+            Reservation.status == ReservationStatus.Active,
+            Reservation.expires_at > now,
+        )
+        .group_by(ReservationItem.product_id)
+    ).all()
+    return {product_id: int(held) for product_id, held in rows}
@@ -0,0 +1,78 @@
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy.orm import Session, configure_mappers
+
+from app.models.order import OrderStatus
+from app.schemas.order import OrderCreate, OrderListResponse, OrderSummaryListResponse
+from app.schemas.product import ProductCreate, ProductListResponse
+from app.services.order_service import (
+    filter_order_summaries,
+    filter_orders,
+    list_order_summaries,
+    list_orders,
+    locked_products_query,
+    order_detail_query,
+)
+from app.services.product_service import list_products, search_all_products, search_products
+from app.services.stock_service import reserved_quantities, utcnow
+
+logger = logging.getLogger(__name__)
+
+def warmup(db: Session) -> None:
+    """
+    Prime the per-process caches hit by the first real requests: mapper
+    configuration, SQLAlchemy's compiled statement cache (populated by
+    executing each hot statement shape once) and the pydantic validators/
+    serializers of the request and response schemas.
+    """
+    configure_mappers()
+
+    today = date.today()
+    list_products(db, 1, 0)
+    search_products(db, "warmup", 1, 0)
+    search_all_products(db, "warmup")
+    list_orders(db, 1, 0)
+    filter_orders(db, None, OrderStatus.Pending, today, today, 1, 0)
+    filter_orders(db, "warmup", OrderStatus.Pending, today, today, 1, 0)
+    list_order_summaries(db, 1, 0)
+    filter_order_summaries(db, "warmup", OrderStatus.Pending, today, today, 1, 0)
+    db.execute(order_detail_query(0)).scalar_one_or_none()
+    # Locks nothing (no product has id 0); only the statement shape matters
+    db.execute(locked_products_query([0])).scalars().all()
+    reserved_quantities(db, [0], utcnow())
+    db.rollback()
+
+    OrderCreate.model_validate({"items": [{"product_id": 1, "quantity": 1}]})
+    ProductCreate.model_validate({"name": "warmup", "price": 0, "stock_quantity": 0})
+    ProductListResponse.model_validate(
+        {"total": 1, "limit": 1, "offset": 0, "items": [
+            {"id": 1, "name": "warmup", "price": 0, "stock_quantity": 0},
+        ]}
+    ).model_dump_json()
+    OrderListResponse.model_validate(
+        {"total": 1, "limit": 1, "offset": 0, "items": [{
+            "id": 1,
+            "status": OrderStatus.Pending,
+            "created_at": datetime.now(timezone.utc),
+            "items": [{
+                "id": 1,
+                "product_id": 1,
+                "product_name": "warmup",
+                "quantity_ordered": 1,
+                "price_at_time_of_order": 0,
+            }],
+        }]}
+    ).model_dump_json()
+    OrderSummaryListResponse.model_validate(
+        {"total": 1, "limit": 1, "offset": 0, "items": [{
+            "id": 1,
+            "status": OrderStatus.Pending,
+            "created_at": datetime.now(timezone.utc),
+            "item_count": 1,
+            "total_quantity": 1,
+            "total_amount": 0,
+        }]}
+    ).model_dump_json()
+
+    logger.info("Warmup complete")
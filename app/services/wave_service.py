@@ -0,0 +1,127 @@
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.order import Order, OrderStatus
+from app.models.order_item import OrderItem
+from app.models.product import Product
+from app.services.order_service import run_order_transaction
+
+# Keeps each IN (...) well under driver/SQLite bind parameter limits
+ID_CHUNK_SIZE = 5000
+
+def _pending_conditions(created_from: datetime | None, created_to: datetime | None) -> list:
+    conditions = [Order.status == OrderStatus.Pending]
+    if created_from:
+        conditions.append(Order.created_at >= created_from)
+    if created_to:
+        conditions.append(Order.created_at < created_to)
+    return conditions
+
+def _load_lines(db: Session, conditions: list) -> list[tuple[int, int, str, int]]:
+    # One set-based query for every line in the window, oldest order first; plain tuples, no ORM objects
+    return db.execute(
+        select(OrderItem.order_id, OrderItem.product_id, Product.name, OrderItem.quantity_ordered)
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(Product, Product.id == OrderItem.product_id)
+        .where(*conditions)
+        .order_by(Order.created_at, Order.id)
+    ).tuples().all()
+
+def _group_by_order(lines) -> list[tuple[int, list[tuple[int, str, int]]]]:
+    # Lines arrive ordered by order, so each order's lines are contiguous
+    orders = []
+    current_id = None
+    current_lines = None
+    for order_id, product_id, product_name, quantity in lines:
+        if order_id != current_id:
+            current_id = order_id
+            current_lines = []
+            orders.append((order_id, current_lines))
+        current_lines.append((product_id, product_name, quantity))
+    return orders
+
+def _build_wave(wave_number: int, orders) -> dict:
+    demand: dict[int, int] = {}
+    names: dict[int, str] = {}
+    line_count = 0
+    for _, lines in orders:
+        line_count += len(lines)
+        for product_id, product_name, quantity in lines:
+            demand[product_id] = demand.get(product_id, 0) + quantity
+            names[product_id] = product_name
+
+    return {
+        "wave_number": wave_number,
+        "order_ids": [order_id for order_id, _ in orders],
+        "line_count": line_count,
+        "total_quantity": sum(demand.values()),
+        "picks": [
+            {"product_id": pid, "product_name": names[pid], "quantity": demand[pid]}
+            for pid in sorted(demand)
+        ],
+    }
+
+def pack_waves(orders, max_orders: int, max_lines: int) -> list[dict]:
+    """
+    Greedy FIFO packing: orders are never split, a wave closes when adding the
+    next order would exceed max_orders or max_lines. An order with more lines
+    than max_lines gets a wave to itself.
+    """
+    waves = []
+    current = []
+    current_lines = 0
+    for order in orders:
+        n_lines = len(order[1])
+        if current and (len(current) >= max_orders or current_lines + n_lines > max_lines):
+            waves.append(_build_wave(len(waves) + 1, current))
+            current = []
+            current_lines = 0
+        current.append(order)
+        current_lines += n_lines
+    if current:
+        waves.append(_build_wave(len(waves) + 1, current))
+    return waves
+
+def plan_waves(
+    db: Session,
+    created_from: datetime | None,
+    created_to: datetime | None,
+    max_orders: int,
+    max_lines: int,
+    mark_shipped: bool,
+) -> dict:
+    conditions = _pending_conditions(created_from, created_to)
+
+    def _plan(lines) -> dict:
+        orders = _group_by_order(lines)
+        return {
+            "order_count": len(orders),
+            "line_count": len(lines),
+            "shipped": mark_shipped,
+            "waves": pack_waves(orders, max_orders, max_lines),
+        }
+
+    if not mark_shipped:
+        return _plan(_load_lines(db, conditions))
+
+    def _plan_and_ship() -> dict:
+        # Lock the window's Pending orders; ones busy in another transaction are left for the next wave
+        locked = set(db.execute(
+            select(Order.id).where(*conditions).with_for_update(skip_locked=True)
+        ).scalars().all())
+        lines = [line for line in _load_lines(db, conditions) if line[0] in locked]
+        plan = _plan(lines)
+
+        order_ids = [order_id for wave in plan["waves"] for order_id in wave["order_ids"]]
+        for i in range(0, len(order_ids), ID_CHUNK_SIZE):
+            db.execute(
+                update(Order)
+                .where(Order.id.in_(order_ids[i:i + ID_CHUNK_SIZE]))
+                .values(status=OrderStatus.Shipped)
+                .execution_options(synchronize_session=False)
+            )
+        return plan
+
+    return run_order_transaction(db, _plan_and_ship)
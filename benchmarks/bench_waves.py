@@ -0,0 +1,91 @@
+"""
+Wave planning benchmark: seeds 100k Pending order lines and times
+plan_waves (read-only, then with mark_shipped) plus response serialization.
+
+    python -m benchmarks.bench_waves
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.bench_waves
+
+Defaults to a throwaway SQLite file. Against Postgres, point it at a scratch
+database: it creates and drops all tables.
+"""
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.order import Order, OrderStatus
+from app.models.order_item import OrderItem
+from app.models.product import Product
+from app.schemas.wave import WavePlanOut
+from app.services.wave_service import plan_waves
+
+N_PRODUCTS = int(os.getenv("BENCH_PRODUCTS", "2000"))
+N_ORDERS = int(os.getenv("BENCH_ORDERS", "25000"))
+LINES_PER_ORDER = int(os.getenv("BENCH_LINES_PER_ORDER", "4"))
+
+def _database_url() -> str:
+    url = os.getenv("BENCH_DATABASE_URL")
+    if url:
+        return url
+    return f"sqlite+pysqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_waves.db')}"
+
+def seed(Session) -> int:
+    start = datetime.now(timezone.utc) - timedelta(days=1)
+    with Session() as db, db.begin():
+        db.execute(insert(Product), [
+            {"id": pid, "name": f"SKU-{pid:06d}", "price": 9.99, "stock_quantity": 1_000_000}
+            for pid in range(1, N_PRODUCTS + 1)
+        ])
+        db.execute(insert(Order), [
+            {"id": oid, "status": OrderStatus.Pending, "created_at": start + timedelta(seconds=oid)}
+            for oid in range(1, N_ORDERS + 1)
+        ])
+        db.execute(insert(OrderItem), [
+            {
+                "order_id": oid,
+                "product_id": (oid * 7919 + line * 104729) % N_PRODUCTS + 1,
+                "quantity_ordered": line + 1,
+                "price_at_time_of_order": 9.99,
+            }
+            for oid in range(1, N_ORDERS + 1)
+            for line in range(LINES_PER_ORDER)
+        ])
+    return N_ORDERS * LINES_PER_ORDER
+
+def timed(label: str, fn):
+    t0 = time.perf_counter()
+    result = fn()
+    print(f"{label:<32} {time.perf_counter() - t0:8.3f}s")
+    return result
+
+def main():
+    engine = create_engine(_database_url())
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    try:
+        n_lines = timed("seed", lambda: seed(Session))
+        print(f"{N_ORDERS} pending orders, {n_lines} lines, {N_PRODUCTS} products")
+
+        def _plan(mark_shipped: bool):
+            with Session() as db:
+                return plan_waves(db, None, None, settings.WAVE_MAX_ORDERS, settings.WAVE_MAX_LINES, mark_shipped)
+
+        plan = timed("plan_waves", lambda: _plan(False))
+        timed("serialize response", lambda: WavePlanOut.model_validate(plan).model_dump_json())
+        shipped = timed("plan_waves mark_shipped=True", lambda: _plan(True))
+
+        print(f"{len(plan['waves'])} waves, {plan['line_count']} lines planned, "
+              f"{shipped['order_count']} orders shipped")
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Gunicorn settings for the production server mode (see scripts/entrypoint.sh).
+
+The app is imported once in the master (preload_app) so workers fork with
+models, routes and schemas already built. The SQLAlchemy engine created at
+import time must not share sockets across processes, so each worker discards
+the inherited pool right after fork and opens its own connections.
+"""
+import math
+import os
+
+def _cgroup_cpu_limit() -> int | None:
+    # CFS quota set by `docker run --cpus`; sched_getaffinity does not see it
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:  # cgroup v2: "<quota> <period>" or "max <period>"
+            quota, period = f.read().split()
+        if quota == "max":
+            return None
+        return max(math.ceil(int(quota) / int(period)), 1)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:  # cgroup v1
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+    except (OSError, ValueError):
+        return None
+    if quota <= 0:
+        return None
+    return max(math.ceil(quota / period), 1)
+
+def _available_cores() -> int:
+    # sched_getaffinity respects CPU pinning in containers; cpu_count does not
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    return min(cores, limit) if limit else cores
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", max(_available_cores(), 1)))
+# Read by the preloaded app to split DB_MAX_CONNECTIONS across workers
+os.environ["WEB_CONCURRENCY"] = str(workers)
+preload_app = True
+
+# Graceful shutdown: on SIGTERM workers stop accepting and finish in-flight requests
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+accesslog = "-"
+errorlog = "-"
+
+def post_fork(server, worker):
+    from app.db.session import engine
+
+    # close=False leaves the parent's connections alone and gives this worker a fresh pool
+    engine.dispose(close=False)
@@ -4,5 +4,15 @@ set -e
 # Apply DB migrations
 alembic upgrade head
 
+# Expire lapsed stock reservations in the background
+export RESERVATION_SWEEPER_ENABLED="${RESERVATION_SWEEPER_ENABLED:-true}"
+
 # Start API
-uvicorn app.main:app --host 0.0.0.0 --port 8000
+# SERVER_MODE=production (default): gunicorn + uvicorn workers, one per core, warmed up before ready
+# SERVER_MODE=dev: single uvicorn process
+if [ "${SERVER_MODE:-production}" = "production" ]; then
+  export WARMUP_ON_STARTUP="${WARMUP_ON_STARTUP:-true}"
+  exec gunicorn app.main:app -c gunicorn.conf.py
+else
+  exec uvicorn app.main:app --host 0.0.0.0 --port 8000
+fi
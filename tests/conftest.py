@@ -3,33 +3,81 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.api.deps import get_db
 from app.db.base import Base
+from app.models.order import Order, OrderStatus
+from app.models.order_item import OrderItem
+from app.models.product import Product
+from app.services.stock_service import utcnow
 
 TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite+pysqlite:///:memory:")
 
 @pytest.fixture()
-def db_session():
-    connect_args = {"check_same_thread": False} if TEST_DATABASE_URL.startswith("sqlite") else {}
-    engine = create_engine(TEST_DATABASE_URL, connect_args=connect_args)
+def session_factory():
+    engine_kwargs = {}
+    if TEST_DATABASE_URL.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+        # Every session must see the same in-memory database
+        engine_kwargs["poolclass"] = StaticPool
+    engine = create_engine(TEST_DATABASE_URL, **engine_kwargs)
     TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
     Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    try:
+        yield TestingSessionLocal
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+@pytest.fixture()
+def db_session(session_factory):
+    db = session_factory()
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
 
 @pytest.fixture()
-def client(db_session):
+def client(session_factory):
+    # Fresh session per request, like get_db, so services can open their own transactions
     def _override_get_db():
-        yield db_session
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
 
     app.dependency_overrides[get_db] = _override_get_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
+
+@pytest.fixture()
+def seed_product(db_session):
+    def _seed_product(name="A", price=10.0, stock=5):
+        p = Product(name=name, price=price, stock_quantity=stock)
+        db_session.add(p)
+        db_session.commit()
+        db_session.refresh(p)
+        return p
+
+    return _seed_product
+
+@pytest.fixture()
+def seed_order(db_session):
+    # lines: [(product, quantity), ...]; bypasses create_order so stock is untouched
+    def _seed_order(lines, status=OrderStatus.Pending, created_at=None):
+        order = Order(status=status, created_at=created_at or utcnow())
+        order.items = [
+            OrderItem(product_id=p.id, quantity_ordered=qty, price_at_time_of_order=float(p.price))
+            for p, qty in lines
+        ]
+        db_session.add(order)
+        db_session.commit()
+        db_session.refresh(order)
+        return order
+
+    return _seed_order
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+
+from app.api.admission import ConcurrencyLimiter, check_threadpool_capacity
+from app.api.routes import orders
+from app.core.config import settings
+from app.core.metrics import counters
+from app.db.transaction import DEADLOCK_DETECTED, LOCK_NOT_AVAILABLE, run_in_transaction
+from app.services.order_service import run_order_transaction
+
+class _PgError(Exception):
+    def __init__(self, pgcode):
+        super().__init__(pgcode)
+        self.pgcode = pgcode
+
+@pytest.fixture(autouse=True)
+def _reset_counters():
+    counters.reset()
+    yield
+    counters.reset()
+
+def test_limiter_sheds_with_retry_after_when_queue_full():
+    limiter = ConcurrencyLimiter("test", max_concurrent=1, max_queue=0, queue_timeout=1, retry_after=2)
+
+    async def scenario():
+        held = limiter()
+        await held.__anext__()
+        try:
+            await limiter().__anext__()
+        finally:
+            await held.aclose()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(scenario())
+
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "2"
+    assert counters.snapshot()["test.shed"] == 1
+
+def test_limiter_times_out_queued_request():
+    limiter = ConcurrencyLimiter("test", max_concurrent=1, max_queue=1, queue_timeout=0.01, retry_after=1)
+
+    async def scenario():
+        held = limiter()
+        await held.__anext__()
+        try:
+            await limiter().__anext__()
+        finally:
+            await held.aclose()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(scenario())
+
+    assert exc.value.status_code == 429
+    assert counters.snapshot()["test.queue_timeout"] == 1
+
+def test_transaction_retries_deadlock(db_session):
+    attempts = []
+
+    def fn():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OperationalError("UPDATE products", {}, _PgError(DEADLOCK_DETECTED))
+        return "done"
+
+    assert run_in_transaction(db_session, fn) == "done"
+    assert len(attempts) == 2
+    assert counters.snapshot()["db.retried"] == 1
+
+def test_admission_metrics_endpoint(client):
+    r = client.get("/metrics/admission")
+    assert r.status_code == 200, r.text
+    assert "counters" in r.json()
+
+def test_lock_timeout_maps_to_503_with_retry_after(db_session):
+    def fn():
+        raise OperationalError("SELECT ... FOR UPDATE", {}, _PgError(LOCK_NOT_AVAILABLE))
+
+    with pytest.raises(HTTPException) as exc:
+        run_order_transaction(db_session, fn)
+
+    assert exc.value.status_code == 503
+    assert "Retry-After" in exc.value.headers
+    assert counters.snapshot()["db.lock_timeout"] == 1
+
+def test_exhausted_deadlock_retries_map_to_503_with_retry_after(db_session, monkeypatch):
+    monkeypatch.setattr(settings, "ORDER_TX_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "ORDER_TX_RETRY_BASE_DELAY_SECONDS", 0)
+
+    def fn():
+        raise OperationalError("UPDATE products", {}, _PgError(DEADLOCK_DETECTED))
+
+    with pytest.raises(HTTPException) as exc:
+        run_order_transaction(db_session, fn)
+
+    assert exc.value.status_code == 503
+    assert "Retry-After" in exc.value.headers
+    assert counters.snapshot()["db.retried"] == 2
+    assert counters.snapshot()["db.retry_exhausted"] == 1
+
+def test_create_order_route_sheds_with_429_when_saturated(client, monkeypatch):
+    monkeypatch.setattr(orders.create_order_limiter, "max_concurrent", 0)
+    monkeypatch.setattr(orders.create_order_limiter, "max_queue", 0)
+
+    r = client.post("/orders", json={"items": [{"product_id": 1, "quantity": 1}]})
+
+    assert r.status_code == 429, r.text
+    assert "retry-after" in r.headers
+    assert counters.snapshot()["orders.create.shed"] == 1
+
+def test_create_order_route_releases_permit_after_response(client, monkeypatch):
+    monkeypatch.setattr(orders.create_order_limiter, "max_concurrent", 1)
+    monkeypatch.setattr(orders.create_order_limiter, "max_queue", 0)
+
+    # With one permit and no queue, a leaked permit would shed the second request
+    for _ in range(2):
+        r = client.post("/orders", json={"items": [{"product_id": 999, "quantity": 1}]})
+        assert r.status_code == 404, r.text
+
+    assert "orders.create.shed" not in counters.snapshot()
+
+def test_default_limits_leave_threadpool_headroom():
+    async def check():
+        return check_threadpool_capacity()
+
+    assert asyncio.run(check())
+
+def test_threadpool_check_flags_limits_that_can_take_every_thread(monkeypatch):
+    monkeypatch.setattr(orders.create_order_limiter, "max_concurrent", 40)
+
+    async def check():
+        return check_threadpool_capacity()
+
+    assert not asyncio.run(check())
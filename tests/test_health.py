@@ -0,0 +1,10 @@
+from app.services.warmup_service import warmup
+
+def test_health_reports_ready_after_startup(client):
+    r = client.get("/health")
+    assert r.status_code == 200, r.text
+    assert r.json() == {"status": "ok"}
+
+def test_warmup_runs_hot_queries_on_empty_db(db_session):
+    warmup(db_session)
+    assert not db_session.in_transaction()
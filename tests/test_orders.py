@@ -36,3 +36,46 @@ def test_list_orders_includes_product_name(client, db_session):
     first_item = data["items"][0]["items"][0]
     assert first_item["product_id"] == p1.id
     assert first_item["product_name"] == "Sugar"
+
+def test_list_orders_summary_view_aggregates_items(client, db_session, seed_order):
+    rice = seed_product(db_session, name="Rice", price=100.0, stock=10)
+    salt = seed_product(db_session, name="Salt", price=2.5, stock=10)
+    seed_order([(rice, 2), (salt, 4)])
+
+    r = client.get("/orders?view=summary")
+    assert r.status_code == 200, r.text
+    summary = r.json()["items"][0]
+
+    assert "items" not in summary
+    assert summary["item_count"] == 2
+    assert summary["total_quantity"] == 6
+    assert summary["total_amount"] == 210.0
+
+def test_search_orders_summary_view_totals_cover_all_lines(client, db_session, seed_order):
+    rice = seed_product(db_session, name="Rice", price=100.0, stock=10)
+    salt = seed_product(db_session, name="Salt", price=2.5, stock=10)
+    seed_order([(rice, 1), (salt, 2)])
+    seed_order([(salt, 1)])
+
+    r = client.get("/orders/search?product_name=ric&view=summary")
+    assert r.status_code == 200, r.text
+    data = r.json()
+
+    assert data["total"] == 1
+    assert data["items"][0]["item_count"] == 2
+    assert data["items"][0]["total_amount"] == 105.0
+
+def test_list_orders_summary_view_paginates_newest_first(client, db_session, seed_order):
+    rice = seed_product(db_session, name="Rice", price=10.0, stock=10)
+    first = seed_order([(rice, 1)]).id
+    second = seed_order([(rice, 2)]).id
+    third = seed_order([(rice, 3)]).id
+
+    r = client.get("/orders?view=summary&limit=2&offset=1")
+    assert r.status_code == 200, r.text
+    data = r.json()
+
+    assert data["total"] == 3
+    assert [o["id"] for o in data["items"]] == [second, first]
+    assert [o["total_quantity"] for o in data["items"]] == [2, 1]
+    assert third not in [o["id"] for o in data["items"]]
@@ -0,0 +1,116 @@
+import threading
+import time
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.core.config import settings
+from app.models.reservation import Reservation, ReservationStatus
+from app.services.reservation_service import sweep_expired_reservations
+from app.services.stock_service import utcnow
+
+def reserve(client, product_id, quantity):
+    return client.post("/reservations", json={"items": [{"product_id": product_id, "quantity": quantity}]})
+
+def test_reservation_holds_stock_until_released(client, db_session, seed_product):
+    p = seed_product(name="Rice", stock=5)
+
+    r = reserve(client, p.id, 4)
+    assert r.status_code == 201, r.text
+    reservation = r.json()
+    assert reservation["status"] == "Active"
+
+    # Held units are unavailable to other holds and to direct orders
+    assert reserve(client, p.id, 2).status_code == 400
+    assert client.post("/orders", json={"items": [{"product_id": p.id, "quantity": 2}]}).status_code == 400
+
+    r = client.post(f"/reservations/{reservation['id']}/release")
+    assert r.status_code == 200, r.text
+    assert r.json()["status"] == "Released"
+
+    assert reserve(client, p.id, 5).status_code == 201
+    db_session.refresh(p)
+    assert p.stock_quantity == 5
+
+def test_confirm_reservation_creates_order_and_deducts_stock(client, db_session, seed_product):
+    p = seed_product(name="Sugar", price=50.0, stock=10)
+    reservation = reserve(client, p.id, 3).json()
+
+    r = client.post(f"/reservations/{reservation['id']}/confirm")
+    assert r.status_code == 201, r.text
+    order = r.json()
+    assert order["status"] == "Pending"
+    assert order["items"][0]["quantity_ordered"] == 3
+    assert order["items"][0]["price_at_time_of_order"] == 50.0
+
+    db_session.refresh(p)
+    assert p.stock_quantity == 7
+
+    r = client.get(f"/reservations/{reservation['id']}")
+    assert r.json()["status"] == "Confirmed"
+    assert r.json()["order_id"] == order["id"]
+
+    assert client.post(f"/reservations/{reservation['id']}/confirm").status_code == 400
+
+def test_expired_reservation_frees_stock_and_is_swept(client, db_session, session_factory, seed_product):
+    p = seed_product(name="Salt", stock=2)
+    reservation = reserve(client, p.id, 2).json()
+
+    db_session.query(Reservation).update({Reservation.expires_at: utcnow() - timedelta(seconds=1)})
+    db_session.commit()
+
+    assert client.post(f"/reservations/{reservation['id']}/confirm").status_code == 400
+    assert reserve(client, p.id, 2).status_code == 201
+
+    with session_factory() as sweeper_db:
+        assert sweep_expired_reservations(sweeper_db, batch_size=1) == 1
+        assert sweeper_db.get(Reservation, reservation["id"]).status == ReservationStatus.Expired
+
+def test_reservation_merges_duplicate_product_lines(client, seed_product):
+    p = seed_product(name="Flour", stock=5)
+
+    def lines(qty):
+        return {"items": [{"product_id": p.id, "quantity": qty}, {"product_id": p.id, "quantity": qty}]}
+
+    r = client.post("/reservations", json=lines(3))
+    assert r.status_code == 400, r.text
+    assert "requested=6" in r.json()["detail"]
+
+    r = client.post("/reservations", json=lines(2))
+    assert r.status_code == 201, r.text
+    assert [(i["product_id"], i["quantity"]) for i in r.json()["items"]] == [(p.id, 4)]
+
+    assert client.post(f"/reservations/{r.json()['id']}/confirm").status_code == 201
+
+def test_shutdown_waits_for_running_sweep(monkeypatch):
+    started = threading.Event()
+    finished = threading.Event()
+
+    def slow_sweep():
+        started.set()
+        time.sleep(0.2)
+        finished.set()
+
+    monkeypatch.setattr(settings, "RESERVATION_SWEEPER_ENABLED", True)
+    monkeypatch.setattr(main, "_run_reservation_sweep", slow_sweep)
+
+    with TestClient(main.app):
+        assert started.wait(timeout=2)
+
+    assert finished.is_set()
+
+def test_order_with_repeated_lines_cannot_consume_held_stock(client, db_session, seed_product):
+    p = seed_product(name="Oats", stock=5)
+    reservation = reserve(client, p.id, 3).json()
+
+    r = client.post("/orders", json={"items": [
+        {"product_id": p.id, "quantity": 2},
+        {"product_id": p.id, "quantity": 2},
+    ]})
+    assert r.status_code == 400, r.text
+    assert "Available=2, requested=4" in r.json()["detail"]
+
+    assert client.post(f"/reservations/{reservation['id']}/confirm").status_code == 201
+    db_session.refresh(p)
+    assert p.stock_quantity == 2
@@ -0,0 +1,13 @@
+from app.db.session import pool_limits
+
+def test_pool_limits_split_connection_budget_across_workers():
+    pool_size, max_overflow = pool_limits(max_connections=80, workers=8)
+    assert (pool_size, max_overflow) == (5, 5)
+    assert 8 * (pool_size + max_overflow) <= 80
+
+def test_pool_limits_shrink_pool_when_many_workers():
+    pool_size, max_overflow = pool_limits(max_connections=80, workers=32)
+    assert (pool_size, max_overflow) == (2, 0)
+
+def test_pool_limits_keep_explicit_values():
+    assert pool_limits(max_connections=80, workers=4, pool_size=3, max_overflow=1) == (3, 1)
@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from app.models.order import OrderStatus
+from app.services.stock_service import utcnow
+
+def test_plan_waves_caps_orders_and_aggregates_demand(client, seed_product, seed_order):
+    rice = seed_product(name="Rice", stock=100)
+    salt = seed_product(name="Salt", stock=100)
+    start = utcnow() - timedelta(minutes=10)
+    o1 = seed_order([(rice, 2), (salt, 1)], created_at=start).id
+    o2 = seed_order([(rice, 3)], created_at=start + timedelta(minutes=1)).id
+    o3 = seed_order([(salt, 4), (rice, 1)], created_at=start + timedelta(minutes=2)).id
+    seed_order([(rice, 9)], status=OrderStatus.Shipped)
+
+    # Line cap is loose here, so only the order cap closes waves
+    r = client.post("/waves/plan", json={"max_orders_per_wave": 2, "max_lines_per_wave": 100})
+    assert r.status_code == 200, r.text
+    plan = r.json()
+
+    assert plan["order_count"] == 3
+    assert plan["line_count"] == 5
+    assert [w["order_ids"] for w in plan["waves"]] == [[o1, o2], [o3]]
+    assert plan["waves"][0]["line_count"] == 3
+    assert plan["waves"][0]["picks"] == [
+        {"product_id": rice.id, "product_name": "Rice", "quantity": 5},
+        {"product_id": salt.id, "product_name": "Salt", "quantity": 1},
+    ]
+
+    # Planning alone leaves orders Pending
+    assert client.get(f"/orders/{o1}").json()["status"] == "Pending"
+
+def test_plan_waves_line_cap_closes_wave_on_its_own(client, seed_product, seed_order):
+    rice = seed_product(name="Rice", stock=100)
+    salt = seed_product(name="Salt", stock=100)
+    start = utcnow() - timedelta(minutes=10)
+    o1 = seed_order([(rice, 1), (salt, 1)], created_at=start).id
+    o2 = seed_order([(rice, 1)], created_at=start + timedelta(minutes=1)).id
+    o3 = seed_order([(rice, 1), (salt, 1)], created_at=start + timedelta(minutes=2)).id
+
+    # Order cap is loose here; o3 would take the first wave to 5 lines
+    r = client.post("/waves/plan", json={"max_orders_per_wave": 100, "max_lines_per_wave": 3})
+    assert r.status_code == 200, r.text
+    waves = r.json()["waves"]
+
+    assert [w["order_ids"] for w in waves] == [[o1, o2], [o3]]
+    assert [w["line_count"] for w in waves] == [3, 2]
+
+def test_plan_waves_gives_oversized_order_its_own_wave(client, seed_product, seed_order):
+    products = [seed_product(name=f"SKU-{i}", stock=100) for i in range(4)]
+    start = utcnow() - timedelta(minutes=10)
+    small = seed_order([(products[0], 1)], created_at=start).id
+    big = seed_order([(p, 1) for p in products], created_at=start + timedelta(minutes=1)).id
+    after = seed_order([(products[1], 1)], created_at=start + timedelta(minutes=2)).id
+
+    r = client.post("/waves/plan", json={"max_orders_per_wave": 100, "max_lines_per_wave": 2})
+    assert r.status_code == 200, r.text
+    waves = r.json()["waves"]
+
+    assert [w["order_ids"] for w in waves] == [[small], [big], [after]]
+    assert waves[1]["line_count"] == 4
+
+def test_plan_waves_mark_shipped_only_touches_window(client, seed_product, seed_order):
+    rice = seed_product(name="Rice", stock=100)
+    now = utcnow()
+    old = seed_order([(rice, 1)], created_at=now - timedelta(days=2)).id
+    recent = seed_order([(rice, 1)], created_at=now - timedelta(hours=1)).id
+
+    r = client.post("/waves/plan", json={
+        "created_from": (now - timedelta(days=1)).isoformat(),
+        "mark_shipped": True,
+    })
+    assert r.status_code == 200, r.text
+    assert r.json()["waves"][0]["order_ids"] == [recent]
+
+    assert client.get(f"/orders/{recent}").json()["status"] == "Shipped"
+    assert client.get(f"/orders/{old}").json()["status"] == "Pending"